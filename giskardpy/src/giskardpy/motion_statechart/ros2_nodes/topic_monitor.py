@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 
+from rclpy.callback_groups import CallbackGroup, MutuallyExclusiveCallbackGroup
 from rclpy.node import MsgType, Node
 from rclpy.publisher import Publisher
 from rclpy.qos import QoSProfile
@@ -16,6 +18,15 @@ from giskardpy.motion_statechart.graph_node import MotionStatechartNode, NodeArt
 from giskardpy.motion_statechart.ros_context import RosContextExtension
 
 
+@lru_cache(maxsize=64)
+def _qos_profile_from_depth(depth: int) -> QoSProfile:
+    """
+    rclpy creates a new QoS profile for every subscription or publisher that is created with a depth.
+    Topic nodes share one profile per depth instead.
+    """
+    return QoSProfile(depth=depth)
+
+
 @dataclass(eq=False, repr=False)
 class TopicNode(MotionStatechartNode, Generic[MsgType]):
     """
@@ -26,10 +37,11 @@ class TopicNode(MotionStatechartNode, Generic[MsgType]):
     """Name of the ROS topic to subscribe to."""
     msg_type: Type[MsgType] = field(kw_only=True)
     """Type of the ROS message."""
-    qos_profile: QoSProfile = field(
-        kw_only=True, default_factory=lambda: QoSProfile(depth=10)
-    )
-    """QoS profile to use when subscribing to the topic."""
+    qos_profile: QoSProfile | int = field(kw_only=True, default=10)
+    """
+    QoS profile to use when subscribing to the topic.
+    If it is an int, it is the history depth of a default QoS profile, which is shared by all nodes with that depth.
+    """
     ros2_node: Node = field(init=False)
 
     def build(self, context: MotionStatechartContext) -> NodeArtifacts:
@@ -37,24 +49,45 @@ class TopicNode(MotionStatechartNode, Generic[MsgType]):
         self.ros2_node = ros_context_extension.ros_node
         return NodeArtifacts()
 
+    def _get_qos_profile(self) -> QoSProfile:
+        if isinstance(self.qos_profile, int):
+            return _qos_profile_from_depth(self.qos_profile)
+        return self.qos_profile
+
 
 @dataclass(eq=False, repr=False)
 class TopicSubscriberNode(TopicNode[MsgType]):
     """
     Superclass for all nodes that subscribe to a ROS topic.
     This node will automatically create a subscriber on build and cache the last message in `current_msg` on_tick.
+
+    .. note:: Only the last message is ever used, so the default QoS profile keeps a history of depth 1.
     """
 
+    qos_profile: QoSProfile | int = field(kw_only=True, default=1)
+    """Subscribers default to a history depth of 1."""
+
     _subscriber: Subscription = field(init=False)
     """Internal ROS subscription object."""
-    __last_msg: MsgType | None = field(init=False, default=None)
+    _callback_group: CallbackGroup = field(
+        init=False, default_factory=MutuallyExclusiveCallbackGroup
+    )
+    """
+    Dedicated callback group of the subscription.
+    A multithreaded executor can run the callback as soon as a message arrives, instead of queueing it behind the
+    other callbacks in the default group of the ros node.
+    As the group is mutually exclusive, messages of this subscription are still stored in the order they arrive.
     """
-    The callback updates this variable.
+    _last_msg_box: List[MsgType | None] = field(
+        init=False, default_factory=lambda: [None]
+    )
+    """
+    The single slot through which the callback hands over the last received message to on_tick.
     Don't use it directly, use `current_msg` instead.
     """
     current_msg: MsgType | None = field(init=False, default=None)
     """
-    __last_msg is copied to this variable on every tick while this node is RUNNING.
+    The last received message is copied to this variable on every tick while this node is RUNNING.
     """
 
     def build(self, context: MotionStatechartContext) -> NodeArtifacts:
@@ -63,18 +96,23 @@ class TopicSubscriberNode(TopicNode[MsgType]):
             msg_type=self.msg_type,
             topic=self.topic_name,
             callback=self.callback,
-            qos_profile=self.qos_profile,
+            qos_profile=self._get_qos_profile(),
+            callback_group=self._callback_group,
         )
         return node_artifacts
 
     def callback(self, msg: MsgType):
-        self.__last_msg = msg
+        """
+        Only stores a reference to the message.
+        Calls never overlap, because the callback group of the subscription is mutually exclusive.
+        """
+        self._last_msg_box[0] = msg
 
     def has_msg(self) -> bool:
         return self.current_msg is not None
 
     def clear_msg(self):
-        self.__last_msg = None
+        self._last_msg_box[0] = None
 
     def on_tick(
         self, context: MotionStatechartContext
@@ -82,7 +120,7 @@ class TopicSubscriberNode(TopicNode[MsgType]):
         """
         .. warning:: If you override this method, make sure to call `super().on_tick(context)`.
         """
-        self.current_msg = self.__last_msg
+        self.current_msg = self._last_msg_box[0]
 
     def on_reset(self, context: MotionStatechartContext):
         self.clear_msg()
@@ -103,7 +141,7 @@ class TopicPublisherNode(TopicNode[MsgType]):
         self._publisher = self.ros2_node.create_publisher(
             msg_type=self.msg_type,
             topic=self.topic_name,
-            qos_profile=self.qos_profile,
+            qos_profile=self._get_qos_profile(),
         )
         return node_artifacts
 
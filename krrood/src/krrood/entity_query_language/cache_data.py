@@ -8,7 +8,7 @@ Cache utilities.
 This module provides caching datastructures and utilities.
 """
 from dataclasses import dataclass, field
-from typing_extensions import Dict, Generic, Iterable, List
+from typing_extensions import Dict, Generic, Iterable, List, Optional
 
 
 @dataclass
@@ -92,7 +92,7 @@ class SeenSet:
         self.exact.clear()
 
 
-@dataclass
+@dataclass(slots=True)
 class ReEnterableLazyIterable(Generic[T]):
     """
     A wrapper for an iterable that allows multiple iterations over its elements,
@@ -139,6 +139,20 @@ class ReEnterableLazyIterable(Generic[T]):
                 except StopIteration:
                     return
 
+    def peek(self, default: Optional[T] = None) -> Optional[T]:
+        """
+        Get the first value without creating an iterator over the values. At most the first value is materialized.
+
+        :param default: The value to return if the iterable is empty.
+        :return: The first value, or `default` if the iterable is empty.
+        """
+        if not self.materialized_values:
+            try:
+                self.materialized_values.append(next(self.iterable))
+            except StopIteration:
+                return default
+        return self.materialized_values[0]
+
     def __bool__(self):
         """
         Return True if the iterable has values, False otherwise.
@@ -6,6 +6,7 @@ It contains classes for simple variables, constant literals, and variables that
 
 from __future__ import annotations
 
+import operator
 import uuid
 from abc import ABC
 from dataclasses import dataclass, field
@@ -22,6 +23,7 @@ from typing_extensions import (
     Callable,
     Iterator,
     List,
+    Tuple,
 )
 
 from krrood.entity_query_language.core.base_expressions import (
@@ -49,6 +51,22 @@ The type of the domain used for the variable.
 """
 
 
+def _make_tuple_getter(keys: Tuple[Any, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Create a function that looks up the given keys in a mapping and always returns the values as a tuple.
+    `operator.itemgetter` returns a bare value for a single key and cannot be created without keys.
+
+    :param keys: The keys to look up.
+    :return: The lookup function.
+    """
+    if len(keys) > 1:
+        return operator.itemgetter(*keys)
+    if len(keys) == 1:
+        [key] = keys
+        return lambda mapping: (mapping[key],)
+    return lambda mapping: ()
+
+
 @dataclass(eq=False, repr=False)
 class CanHaveDomainSource(CanBehaveLikeAVariable[T], ABC):
     """
@@ -114,10 +132,12 @@ class Variable(CanHaveDomainSource[T]):
         """
         Fetch values from the domain values and yield an OperationResult for each.
         """
-
+        id_ = self._id_
+        build_operation_result = self._build_operation_result_and_update_truth_value_
         for v in self._re_enterable_domain_generator_:
-            bindings = {**sources, self._id_: v}
-            yield self._build_operation_result_and_update_truth_value_(bindings)
+            bindings = sources.copy()
+            bindings[id_] = v
+            yield build_operation_result(bindings)
 
     def _replace_child_field_(
         self, old_child: SymbolicExpression, new_child: SymbolicExpression
@@ -128,11 +148,11 @@ class Variable(CanHaveDomainSource[T]):
     def _name_(self) -> str:
         if self._type_:
             return self._type_.__name__
-        try:
-            first_value = next(iter(self._re_enterable_domain_generator_))
-            return f"{self.__class__.__name__}({type(first_value).__name__}, ...)"
-        except StopIteration:
+        empty = object()
+        first_value = self._re_enterable_domain_generator_.peek(empty)
+        if first_value is empty:
             return f"{self.__class__.__name__}()"
+        return f"{self.__class__.__name__}({type(first_value).__name__}, ...)"
 
 
 @dataclass(eq=False, repr=False)
@@ -160,6 +180,18 @@ class Literal(Variable[T]):
         self._domain_ = [self._value_]
         super().__post_init__()
 
+    def _evaluate__(
+        self,
+        sources: Bindings,
+    ) -> Iterable[OperationResult]:
+        """
+        Yield the single OperationResult of the value. As the domain is always a singleton, this skips iterating over
+        the domain generator.
+        """
+        bindings = sources.copy()
+        bindings[self._id_] = self._domain_[0]
+        yield self._build_operation_result_and_update_truth_value_(bindings)
+
     @cached_property
     def _name_(self) -> str:
         if self._name__:
@@ -198,6 +230,21 @@ class InstantiatedVariable(
     """
     A dictionary mapping child variable ids to their names. 
     """
+    _child_ids_: Tuple[uuid.UUID, ...] = field(default=(), init=False, repr=False)
+    """
+    The ids of the child variables, in the same order as `_child_names_`.
+    """
+    _child_names_: Tuple[str, ...] = field(default=(), init=False, repr=False)
+    """
+    The names of the child variables, in the same order as `_child_ids_`. Together, they allow looking up the keyword
+    arguments of each instance from the bindings without any per-child dictionary lookups in the map above.
+    """
+    _child_values_getter_: Callable[[Bindings], Tuple[Any, ...]] = field(
+        init=False, repr=False
+    )
+    """
+    Extracts the values of all child variables from the bindings in one call, in the order of `_child_ids_`.
+    """
     _domain_source_: DomainSource = field(init=False, default=DomainSource.DEDUCTION)
     """
     The source of the domain for InstantiatedVariable is always DEDUCED.
@@ -205,6 +252,7 @@ class InstantiatedVariable(
 
     def __post_init__(self):
         self._update_child_vars_from_kwargs_()
+        self._update_child_ids_and_names_()
         self._operation_children_ = tuple(self._child_vars_.values())
         # This is done here as it uses `_operation_children_`
         super().__post_init__()
@@ -221,6 +269,14 @@ class InstantiatedVariable(
             )
             self._child_var_id_name_map_[self._child_vars_[k]._id_] = k
 
+    def _update_child_ids_and_names_(self):
+        """
+        Freeze the child variable ids and names into parallel tuples.
+        """
+        self._child_ids_ = tuple(self._child_var_id_name_map_.keys())
+        self._child_names_ = tuple(self._child_var_id_name_map_.values())
+        self._child_values_getter_ = _make_tuple_getter(self._child_ids_)
+
     def _evaluate__(
         self,
         sources: Bindings,
@@ -233,15 +289,27 @@ class InstantiatedVariable(
         """
         Create new instances of the variable type and using as keyword arguments the child variables values.
         """
+        type_ = self._type_
+        id_ = self._id_
+        child_ids, child_names = self._child_ids_, self._child_names_
+        child_values_getter = self._child_values_getter_
+        all_children_bound = True
         for child_result in self._evaluate_product_(sources):
-            # Build once: unwrapped hashed kwargs for already provided child vars
-            kwargs = {
-                self._child_var_id_name_map_[id_]: v
-                for id_, v in child_result.bindings.items()
-                if id_ in self._child_var_id_name_map_
-            }
-            instance = self._type_(**kwargs)
-            bindings = {self._id_: instance} | child_result.bindings
+            child_bindings = child_result.bindings
+            if all_children_bound:
+                try:
+                    kwargs = dict(zip(child_names, child_values_getter(child_bindings)))
+                except KeyError:
+                    # Some children, like logical operators, do not bind their own id, so stop trying the fast path.
+                    all_children_bound = False
+            if not all_children_bound:
+                kwargs = {
+                    name: child_bindings[child_id]
+                    for child_id, name in zip(child_ids, child_names)
+                    if child_id in child_bindings
+                }
+            instance = type_(**kwargs)
+            bindings = {id_: instance} | child_bindings
             result = self._build_operation_result_and_update_truth_value_(
                 bindings, child_result
             )
@@ -257,8 +325,10 @@ class InstantiatedVariable(
         for k, v in self._child_vars_.items():
             if v is old_child:
                 self._child_vars_[k] = new_child
-                self._child_var_id_name_map_[self._child_vars_[k]._id_] = k
+                del self._child_var_id_name_map_[old_child._id_]
+                self._child_var_id_name_map_[new_child._id_] = k
                 break
+        self._update_child_ids_and_names_()
 
     @cached_property
     def _name_(self):
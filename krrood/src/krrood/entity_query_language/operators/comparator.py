@@ -51,6 +51,13 @@ class Comparator(BinaryExpression, PerformsCartesianProduct):
         operator.gt: ">",
         operator.ge: ">=",
     }
+    set_comparison_operations: ClassVar[Tuple[Callable[[Any, Any], bool], ...]] = (
+        operator.eq,
+        operator.ne,
+    )
+    """
+    Operations for which two iterable operands are compared as sets.
+    """
 
     @property
     def _product_operands_(self) -> Tuple[SymbolicExpression, ...]:
@@ -87,7 +94,7 @@ class Comparator(BinaryExpression, PerformsCartesianProduct):
             self.right._process_result_(child_result),
         )
         if (
-            self.operation in [operator.eq, operator.ne]
+            self.operation in self.set_comparison_operations
             and is_iterable(left_value)
             and is_iterable(right_value)
         ):
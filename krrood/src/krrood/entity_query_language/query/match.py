@@ -27,6 +27,7 @@ from typing_extensions import (
     Dict,
     Generator,
     Iterator,
+    Iterable,
 )
 
 from krrood.adapters.json_serializer import list_like_classes
@@ -379,11 +380,18 @@ class Match(AbstractMatchExpression[T], HasFactoryAndKwargs[T]):
         self.expression.build()
         return self
 
-    def _update_kwargs_from_literal_values(self):
+    def _update_kwargs_from_literal_values(
+        self, attribute_matches: Optional[Iterable[AttributeMatch]] = None
+    ):
         """
         Update the kwargs dictionary with values from this statements leaves.
+
+        :param attribute_matches: The leaves to update from. Defaults to `matches_with_variables`; pass them if they
+        were already computed to avoid traversing the statement again.
         """
-        for attribute_match in self.matches_with_variables:
+        if attribute_matches is None:
+            attribute_matches = self.matches_with_variables
+        for attribute_match in attribute_matches:
             attribute_match._update_kwargs_from(self)
 
     def _get_mapped_variable_by_name(self, name: str) -> MappedVariable:
@@ -260,10 +260,11 @@ class DomainValueExtractor:
         if not hasattr(variable, "_domain_"):
             return variable.value if hasattr(variable, "value") else variable
 
-        try:
-            sample = next(iter(variable._re_enterable_domain_generator_)).value
-        except (StopIteration, AttributeError):
+        empty = object()
+        first_value = variable._re_enterable_domain_generator_.peek(empty)
+        if first_value is empty or not hasattr(first_value, "value"):
             return variable.value if hasattr(variable, "value") else variable
+        sample = first_value.value
 
         if isinstance(variable, Literal):
             return sample
@@ -17,3 +17,16 @@ class WhereExpressionNotInDisjunctiveNormalForm(DataclassException):
 
     def __post_init__(self):
         self.message = f"The where expression {self.where_expression} is not in disjunctive normal form."
+
+
+@dataclass
+class DuplicateParameterName(DataclassException):
+    """
+    Raised when two variables of an underspecified statement have the same name, such that sampled values cannot be
+    mapped back to a unique variable.
+    """
+
+    name: str
+
+    def __post_init__(self):
+        self.message = f"More than one variable of the statement is named {self.name}."
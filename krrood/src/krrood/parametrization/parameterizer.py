@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import sys
 import typing
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 from typing_extensions import Any
@@ -11,9 +12,12 @@ from typing_extensions import Any
 import random_events.variable
 from krrood.entity_query_language.core.base_expressions import SymbolicExpression
 from krrood.entity_query_language.factories import and_
-from krrood.entity_query_language.query.match import MatchVariable
+from krrood.entity_query_language.core.mapped_variable import MappedVariable
+from krrood.entity_query_language.query.match import AttributeMatch, MatchVariable
+from krrood.parametrization.exceptions import DuplicateParameterName
 from krrood.parametrization.random_events_translator import (
     WhereExpressionToRandomEventTranslator,
+    cached_variable_from_name_and_type,
 )
 from random_events.product_algebra import Event
 from random_events.set import Set
@@ -54,6 +58,31 @@ class UnderspecifiedParameters:
         if self.statement._where_conditions_:
             self.truncation_event = self._random_event_compiler.translate()
 
+    @cached_property
+    def _matches_with_variables(self) -> Tuple[AttributeMatch, ...]:
+        """
+        :return: The attribute matches of the statement that have variables.
+        The statement is built in `__post_init__`, hence this is only traversed once.
+        """
+        return tuple(self.statement.matches_with_variables)
+
+    @cached_property
+    def _mapped_variables_by_name(self) -> Dict[str, MappedVariable]:
+        """
+        :return: A dictionary that maps the names of the attribute matches to their assigned variables.
+        The names are interned, such that looking them up with the names of the variables created in `variables`
+        only compares identities.
+        :raises DuplicateParameterName: If two attribute matches have the same name, even if that name is never
+        sampled, since the statement cannot be parameterized unambiguously.
+        """
+        result = {}
+        for attribute_match in self._matches_with_variables:
+            name = sys.intern(attribute_match.name_from_variable_access_path)
+            if name in result:
+                raise DuplicateParameterName(name)
+            result[name] = attribute_match.assigned_variable
+        return result
+
     @cached_property
     def variables(self) -> Dict[str, random_events.variable.Variable]:
         """
@@ -62,8 +91,8 @@ class UnderspecifiedParameters:
         """
         result = {v.name: v for v in self._random_event_compiler.variables.values()}
 
-        for attribute_match in self.statement.matches_with_variables:
-            name = attribute_match.name_from_variable_access_path
+        for attribute_match in self._matches_with_variables:
+            name = sys.intern(attribute_match.name_from_variable_access_path)
 
             if isinstance(attribute_match.assigned_value, SymbolicExpression):
                 random_events_variable = random_events.variable.Symbolic(
@@ -79,7 +108,7 @@ class UnderspecifiedParameters:
             ):
                 continue
 
-            random_events_variable = random_events.variable.variable_from_name_and_type(
+            random_events_variable = cached_variable_from_name_and_type(
                 name, attribute_match.assigned_variable._type_
             )
 
@@ -95,7 +124,7 @@ class UnderspecifiedParameters:
         conditioning a probabilistic model. These values ignore the `where` conditions.
         """
         result = {}
-        for literal in self.statement.matches_with_variables:
+        for literal in self._matches_with_variables:
             variable = self.variables.get(literal.assigned_variable._name_, None)
             if variable is None or isinstance(
                 literal.assigned_variable._value_, (type(Ellipsis), SymbolicExpression)
@@ -119,9 +148,7 @@ class UnderspecifiedParameters:
         """
 
         for variable_, value in zip(variables, sample):
-            mapped_variable = self.statement._get_mapped_variable_by_name(
-                variable_.name
-            )
+            mapped_variable = self._mapped_variables_by_name[variable_.name]
 
             if not variable_.is_numeric:
                 [value] = [
@@ -133,6 +160,6 @@ class UnderspecifiedParameters:
                 value = value.item()
             mapped_variable._value_ = value
 
-        self.statement._update_kwargs_from_literal_values()
+        self.statement._update_kwargs_from_literal_values(self._matches_with_variables)
         result = self.statement.construct_instance()
         return result
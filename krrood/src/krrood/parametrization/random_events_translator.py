@@ -4,8 +4,8 @@ import itertools
 import operator
 from collections import deque
 from dataclasses import dataclass
-from functools import cached_property
-from typing import assert_never, List, Dict
+from functools import cached_property, lru_cache
+from typing import assert_never, List, Dict, Type
 
 import numpy as np
 
@@ -24,6 +24,24 @@ from random_events.interval import closed_open, closed, open
 from random_events.product_algebra import Event, SimpleEvent
 
 
+@lru_cache(maxsize=1024)
+def cached_variable_from_name_and_type(
+    name: str, type_: Type
+) -> random_events.variable.Variable:
+    """
+    Cached version of :func:`random_events.variable.variable_from_name_and_type`.
+    The created variable only depends on the name and type, hence parameterizing the same statement many times
+    reuses the same variables instead of constructing new ones.
+    The cache is bounded, such that processes that create many different statements don't keep all their variables
+    alive.
+
+    :param name: The name of the variable.
+    :param type_: The type of the variable.
+    :return: The variable.
+    """
+    return random_events.variable.variable_from_name_and_type(name, type_)
+
+
 @dataclass
 class WhereExpressionToRandomEventTranslator:
     """
@@ -54,10 +72,8 @@ class WhereExpressionToRandomEventTranslator:
         ):
             if not is_literal_comparator(comparator):
                 continue
-            result[comparator.left] = (
-                random_events.variable.variable_from_name_and_type(
-                    comparator.left._name_, comparator.left._type_
-                )
+            result[comparator.left] = cached_variable_from_name_and_type(
+                comparator.left._name_, comparator.left._type_
             )
         return result
 
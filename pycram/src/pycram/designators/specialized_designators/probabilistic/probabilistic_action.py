@@ -70,9 +70,13 @@ class ProbabilisticAction:
         """
         :return: The default policy for the action.
         """
-        means = {v: 0 for v in self.variables.all() if v.is_numeric}
-        variances = {v: 1 for v in self.variables.all() if v.is_numeric}
-        model = fully_factorized(self.variables.all(), means, variances)
+        variables = self.variables.all()
+        means, variances = {}, {}
+        for v in variables:
+            if v.is_numeric:
+                means[v] = 0
+                variances[v] = 1
+        model = fully_factorized(variables, means, variances)
         return model
 
 
@@ -220,6 +220,12 @@ class Integer(Variable):
         return Continuous.make_value(self, value)
 
 
+_variable_factories = {int: Integer, float: Continuous}
+"""
+Factories for the most common exact types, such that they can be looked up without walking the subclass checks.
+"""
+
+
 def variable_from_name_and_type(name: str, type_: Type) -> Variable:
     """
     Create a variable from a name and type.
@@ -228,6 +234,10 @@ def variable_from_name_and_type(name: str, type_: Type) -> Variable:
     :param type_: The type of the variable
     :return: The created variable
     """
+    factory = _variable_factories.get(type_)
+    if factory is not None:
+        return factory(name)
+
     if issubclass(type_, enum.Enum):
         result = Symbolic(name, Set.from_iterable(type_))
     elif issubclass(type_, bool):
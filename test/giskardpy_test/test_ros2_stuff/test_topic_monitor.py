@@ -0,0 +1,32 @@
+from geometry_msgs.msg import WrenchStamped
+from rclpy.qos import QoSProfile
+
+from giskardpy.motion_statechart.ros2_nodes.topic_monitor import (
+    PublishOnStart,
+    WaitForMessage,
+)
+
+
+def test_qos_profile_depth_is_shared():
+    subscriber = WaitForMessage(topic_name="topic", msg_type=WrenchStamped)
+    other_subscriber = WaitForMessage(topic_name="other_topic", msg_type=WrenchStamped)
+    publisher = PublishOnStart(topic_name="topic", msg=WrenchStamped(), qos_profile=1)
+
+    qos_profile = subscriber._get_qos_profile()
+    assert isinstance(qos_profile, QoSProfile)
+    assert qos_profile.depth == 1
+    assert other_subscriber._get_qos_profile() is qos_profile
+    assert publisher._get_qos_profile() is qos_profile
+
+
+def test_explicit_qos_profile_is_used_as_is():
+    qos_profile = QoSProfile(depth=5)
+    subscriber = WaitForMessage(
+        topic_name="topic", msg_type=WrenchStamped, qos_profile=qos_profile
+    )
+    assert subscriber._get_qos_profile() is qos_profile
+
+
+def test_qos_profile_depth_to_json():
+    subscriber = WaitForMessage(topic_name="topic", msg_type=WrenchStamped)
+    assert subscriber.to_json()["qos_profile"] == 1
@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 from sqlalchemy.orm import sessionmaker
 
 from krrood.entity_query_language.backends import (
@@ -13,12 +15,13 @@ from krrood.entity_query_language.factories import (
     variable_from,
 )
 from krrood.ormatic.dao import to_dao
+from krrood.parametrization.exceptions import DuplicateParameterName
 from krrood.parametrization.model_registries import DictRegistry
 from krrood.parametrization.parameterizer import UnderspecifiedParameters
 from probabilistic_model.probabilistic_circuit.rx.helper import fully_factorized
 from random_events.set import Set
 from random_events.variable import Symbolic
-from ..dataset.example_classes import Pose, Position, Orientation
+from ..dataset.example_classes import Pose, Position, Orientation, Positions
 
 
 def test_same_query_multiple_backends(session, database):
@@ -75,3 +78,24 @@ def test_probabilistic_backend_with_symbolic_expression():
     assert parameters.variables["Position.z"] == Symbolic(
         "Position.z", Set.from_iterable([1, 2, 3])
     )
+
+
+def test_parameterizing_the_same_statement_reuses_variables():
+    prob_q = underspecified(Position)(x=..., y=..., z=...)
+    variables = UnderspecifiedParameters(prob_q).variables
+    other_variables = UnderspecifiedParameters(prob_q).variables
+    assert variables.keys() == other_variables.keys()
+    for name, variable_ in variables.items():
+        assert other_variables[name] is variable_
+
+
+def test_duplicate_parameter_names():
+    # the same match appears twice in the list, hence both get the same access path
+    position = underspecified(Position)(x=..., y=0.0, z=0.0)
+    prob_q = underspecified(Positions)(positions=[position, position], some_strings=[])
+    parameters = UnderspecifiedParameters(prob_q)
+    variables = list(parameters.variables.values())
+    with pytest.raises(DuplicateParameterName):
+        parameters.create_instance_from_variables_and_sample(
+            variables, np.zeros(len(variables))
+        )
@@ -0,0 +1,33 @@
+from krrood.entity_query_language.cache_data import ReEnterableLazyIterable
+
+
+def _lazy_iterable(values):
+    lazy_iterable = ReEnterableLazyIterable()
+    lazy_iterable.set_iterable(values)
+    return lazy_iterable
+
+
+def test_peek_empty_iterable_returns_default():
+    lazy_iterable = _lazy_iterable([])
+    default = object()
+    assert lazy_iterable.peek(default) is default
+    assert lazy_iterable.peek() is None
+    assert list(lazy_iterable) == []
+
+
+def test_peek_materializes_only_the_first_value():
+    lazy_iterable = _lazy_iterable([1, 2, 3])
+    assert lazy_iterable.peek() == 1
+    assert lazy_iterable.materialized_values == [1]
+    assert lazy_iterable.peek() == 1
+    assert list(lazy_iterable) == [1, 2, 3]
+
+
+def test_peek_while_iterating():
+    lazy_iterable = _lazy_iterable([1, 2, 3])
+    iterator = iter(lazy_iterable)
+    assert next(iterator) == 1
+    assert next(iterator) == 2
+    assert lazy_iterable.peek() == 1
+    assert list(iterator) == [3]
+    assert list(lazy_iterable) == [1, 2, 3]
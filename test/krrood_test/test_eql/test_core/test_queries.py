@@ -34,6 +34,7 @@ from krrood.entity_query_language.exceptions import (
     UnsupportedExpressionTypeForDistinct,
     TryingToModifyAnAlreadyBuiltQuery,
 )
+from krrood.entity_query_language.core.variable import InstantiatedVariable, Literal
 from krrood.entity_query_language.predicate import (
     HasType,
     symbolic_function,
@@ -1262,3 +1263,21 @@ def test_accessing_dunder_methods():
     results = world_class_starting_with_c.tolist()
     assert len(results) == 3
     assert set(results) == {c for c in world_classes if c.__name__.startswith("C")}
+
+
+def test_instantiated_variable_uses_replaced_child_while_old_child_is_still_bound():
+    old_child, new_child, other_child = (
+        Literal(_value_=1),
+        Literal(_value_=2),
+        Literal(_value_=3),
+    )
+    instantiated = InstantiatedVariable(
+        _type_=dict, _kwargs_={"x": old_child, "y": other_child}
+    )
+    instantiated._replace_child_(old_child, new_child)
+
+    # The new child is bound before the old one, so scanning the bindings would end with the stale value.
+    results = list(instantiated._evaluate_({new_child._id_: 2, old_child._id_: 1}))
+    assert [result.bindings[instantiated._id_] for result in results] == [
+        {"x": 2, "y": 3}
+    ]
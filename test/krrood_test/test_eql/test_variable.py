@@ -0,0 +1,23 @@
+import pytest
+
+from krrood.entity_query_language.core.variable import (
+    InstantiatedVariable,
+    Literal,
+    _make_tuple_getter,
+)
+
+
+@pytest.mark.parametrize("keys", [(), ("a",), ("a", "b", "c")])
+def test_make_tuple_getter_always_returns_a_tuple(keys):
+    mapping = {"a": 1, "b": 2, "c": 3, "d": 4}
+    assert _make_tuple_getter(keys)(mapping) == tuple(mapping[key] for key in keys)
+
+
+@pytest.mark.parametrize("kwargs", [{"a": 1}, {"a": 1, "b": 2, "c": 3}])
+def test_instantiated_variable_kwargs_from_child_bindings(kwargs):
+    instantiated = InstantiatedVariable(
+        _type_=dict,
+        _kwargs_={name: Literal(_value_=value) for name, value in kwargs.items()},
+    )
+    results = list(instantiated._evaluate_())
+    assert [result.bindings[instantiated._id_] for result in results] == [kwargs]
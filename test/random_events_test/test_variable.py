@@ -1,5 +1,5 @@
 import unittest
-from enum import IntEnum
+from enum import Enum, IntEnum
 
 import numpy as np
 
@@ -99,5 +99,39 @@ class CustomObjectSetTestCase(unittest.TestCase):
         self.assertFalse(se.is_empty())
 
 
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+    BLUE = "blue"
+
+
+class Size(IntEnum):
+    SMALL = 1
+    LARGE = 2
+
+
+class Count(int):
+    pass
+
+
+class VariableFromNameAndTypeTestCase(unittest.TestCase):
+
+    def test_variable_type(self):
+        for type_, variable_type, domain_size in [
+            (int, Integer, None),
+            (float, Continuous, None),
+            (bool, Symbolic, 2),
+            (Color, Symbolic, 3),
+            (Size, Symbolic, 2),
+            (Count, Integer, None),
+        ]:
+            with self.subTest(type_=type_):
+                x = variable_from_name_and_type("x", type_)
+                self.assertIs(type(x), variable_type)
+                self.assertEqual(x.name, "x")
+                if domain_size is not None:
+                    self.assertEqual(len(x.domain.simple_sets), domain_size)
+
+
 if __name__ == "__main__":
     unittest.main()